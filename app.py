@@ -17,6 +17,7 @@ from assisstants.logging.logger import logging
 import sys
 import time
 import threading
+from contextlib import contextmanager
 from typing import Dict, Optional
 
 from assisstants.loader.model_loader import ModelLoader
@@ -24,6 +25,7 @@ from assisstants.processor.text_processor import TextProcessor
 from assisstants.Classifier.text_classifier import TextClassifier
 from assisstants.extractor.fields_extractor import ExtractFields
 from assisstants.voice.voice import speech_to_text
+from assisstants.profiler.request_profiler import profiled
 
 import streamlit as st
 import re
@@ -58,8 +60,22 @@ def get_extractor():
 def get_text_processor():
     return TextProcessor()
 
+def get_validator():
+    # not st.cache_resource: it would keep the None of a failed load; ModelLoader memoizes
+    return ModelLoader.get_record_validator()
+
 
 # Utility Functions
+@contextmanager
+def track_cpu(section: str):
+    """Log server CPU spent rendering a section; each session's script runs on its own thread."""
+    start = time.thread_time()
+    try:
+        yield
+    finally:
+        logging.info(f"Render CPU [{section}]: {(time.thread_time() - start) * 1000:.2f} ms")
+
+
 def init_session_state():
     if "initialized" not in st.session_state:
         st.session_state.initialized = True
@@ -74,6 +90,8 @@ def init_session_state():
         st.session_state.pending_retry = False
         st.session_state.capture_duration = 5  # seconds default
         st.session_state.active_field_focus = None  # field currently being updated
+        st.session_state.form_changed = False  # set by fragment callbacks that affect the whole page
+        st.session_state.suggested_entity = None  # known number one edit away from the heard one
         logging.info("Session state initialized")
 
 
@@ -83,7 +101,21 @@ def remaining_fields():
 
 
 def all_fields_filled():
-    return all(st.session_state.form_data[FIELD_KEY_MAP[f]] for f in TARGET_FIELDS_ORDER)
+    return st.session_state.progress_count == len(TARGET_FIELDS_ORDER)
+
+
+def update_progress():
+    """Recompute the memoized progress count after form_data changes."""
+    before = st.session_state.progress_count
+    st.session_state.progress_count = sum(1 for f in TARGET_FIELDS_ORDER if st.session_state.form_data[FIELD_KEY_MAP[f]])
+    return st.session_state.progress_count != before
+
+
+def rerun_app_if_form_changed():
+    """Progress, status panel and section layout live outside the fragments; refresh them on demand."""
+    if st.session_state.form_changed:
+        st.session_state.form_changed = False
+        st.rerun()
 
 
 def capture_speech_blocking(duration: int = 5):
@@ -104,6 +136,7 @@ def capture_speech_blocking(duration: int = 5):
         return "[API Error]"
 
 
+@profiled("process_and_extract")
 def process_and_extract(text: str):
     processor = get_text_processor()
     classifier = get_classifier()
@@ -228,7 +261,21 @@ def process_and_extract(text: str):
                 entity = ' '.join(raw_tokens[-2:]).title()
                 fallback_reason = 'last tokens heuristic'
 
-    if st.session_state.get('debug_mode'):
+    # ---- Validation against known records (phone / account) ---- #
+    # Only the extracted value can be verified; anything else is offered as "did you mean"
+    validation = None
+    try:
+        validator = get_validator()
+        if validator is not None and validator.supports(label):
+            validation = validator.validate(label, entity, processed)
+            if validation and validation.status == 'verified':
+                entity = validation.value
+            logging.info(f"Validation: label={label} status={validation.status if validation else None}")
+    except Exception as e:
+        logging.error(f"Validation error: {e}")
+
+    # no session outside `streamlit run` (e.g. the in-process load tester)
+    if st.runtime.exists() and st.session_state.get('debug_mode'):
         with st.expander('🔍 Debug Output', expanded=True):
             st.write({
                 'raw_input': text,
@@ -240,9 +287,10 @@ def process_and_extract(text: str):
                 'final_entity': entity,
                 'heuristic_used': heuristic_used,
                 'fallback_reason': fallback_reason,
+                'validation': vars(validation) if validation else None,
             })
 
-    return processed, label, entity
+    return processed, label, entity, validation
 
 
 def confirm_entity():
@@ -252,13 +300,18 @@ def confirm_entity():
         return
     key = FIELD_KEY_MAP.get(label)
     if key:
+        # the Field Status panel outside the fragments prints every value, not just the count
+        changed = st.session_state.form_data[key] != entity
         st.session_state.form_data[key] = entity
         st.session_state.history.append({"label": label, "entity": entity})
         st.session_state.captured_text = ""
         st.session_state.predicted_label = None
         st.session_state.extracted_entity = None
         st.session_state.pending_retry = False
-        st.session_state.progress_count = sum(1 for f in TARGET_FIELDS_ORDER if st.session_state.form_data[FIELD_KEY_MAP[f]])
+        st.session_state.suggested_entity = None
+        update_progress()
+        if changed:
+            st.session_state.form_changed = True
 
 
 def reset_current_capture():
@@ -266,12 +319,37 @@ def reset_current_capture():
     st.session_state.predicted_label = None
     st.session_state.extracted_entity = None
     st.session_state.pending_retry = False
+    st.session_state.suggested_entity = None
 
 
 def reset_field(field_label: str):
     key = FIELD_KEY_MAP[field_label]
     st.session_state.form_data[key] = ""
-    st.session_state.progress_count = sum(1 for f in TARGET_FIELDS_ORDER if st.session_state.form_data[FIELD_KEY_MAP[f]])
+    update_progress()
+
+
+# Callbacks run before the fragment reruns, so a click costs one fragment render
+def on_confirm_entity():
+    if not st.session_state.extracted_entity and st.session_state.get("manual_entry"):
+        st.session_state.extracted_entity = st.session_state.manual_entry
+    confirm_entity()
+    # shown by the confirmation section; once the form is complete the editor replaces it
+    st.session_state.saved_notice = not all_fields_filled()
+
+
+def on_accept_suggestion():
+    st.session_state.extracted_entity = st.session_state.suggested_entity
+    st.session_state.suggested_entity = None
+
+
+def on_field_edit(key: str):
+    value = st.session_state[f"edit_{key}"]
+    changed = st.session_state.form_data[key] != value
+    st.session_state.form_data[key] = value
+    st.session_state.form_edited = True
+    update_progress()
+    if changed:
+        st.session_state.form_changed = True
 
 
 def download_form_txt():
@@ -309,8 +387,7 @@ def render_header():
 
 def render_progress():
     total = len(TARGET_FIELDS_ORDER)
-    completed = sum(1 for f in TARGET_FIELDS_ORDER if st.session_state.form_data[FIELD_KEY_MAP[f]])
-    st.progress(completed / total)
+    st.progress(st.session_state.progress_count / total)
     cols = st.columns(total)
     for i, f in enumerate(TARGET_FIELDS_ORDER):
         filled = bool(st.session_state.form_data[FIELD_KEY_MAP[f]])
@@ -326,93 +403,100 @@ def render_field_status_panel():
             st.markdown(f"<div class='{css}'><strong>{f}:</strong> {val if val else 'Pending'}</div>", unsafe_allow_html=True)
 
 
+@st.fragment
 def render_capture_section():
-    st.subheader("1. Capture Speech")
-    st.checkbox("Debug mode", key='debug_mode', help="Show internal processing details")
-    st.slider("Recording duration (seconds)", min_value=2, max_value=12, key="capture_duration")
-    capture_button = st.button("🎤 Capture Speech", type="primary")
-    if capture_button:
-        with st.spinner("Listening..."):
-            text = capture_speech_blocking(st.session_state.capture_duration)
-        st.session_state.captured_text = text
-        if text in ("[Unrecognized Speech]", "[API Error]", ""):
-            st.session_state.pending_retry = True
-            st.warning("Speech not recognized. Please try again.")
-        else:
-            with st.spinner("Processing & extracting..."):
-                processed, label, entity = process_and_extract(text)
-            st.session_state.predicted_label = label
-            st.session_state.extracted_entity = entity
-            st.session_state.pending_retry = False
-            logging.info(f"Captured: label={label} entity={entity}")
-
-    if st.session_state.captured_text:
-        st.markdown("**Transcript:**")
-        st.info(st.session_state.captured_text)
-
-
+    with track_cpu("capture"):
+        st.subheader("1. Capture Speech")
+        st.checkbox("Debug mode", key='debug_mode', help="Show internal processing details")
+        st.slider("Recording duration (seconds)", min_value=2, max_value=12, key="capture_duration")
+        capture_button = st.button("🎤 Capture Speech", type="primary")
+        if capture_button:
+            with st.spinner("Listening..."):
+                text = capture_speech_blocking(st.session_state.capture_duration)
+            st.session_state.captured_text = text
+            if text in ("[Unrecognized Speech]", "[API Error]", ""):
+                st.session_state.pending_retry = True
+                st.warning("Speech not recognized. Please try again.")
+            else:
+                with st.spinner("Processing & extracting..."):
+                    processed, label, entity, validation = process_and_extract(text)
+                st.session_state.predicted_label = label
+                st.session_state.extracted_entity = entity
+                st.session_state.suggested_entity = (
+                    validation.candidates[0] if validation and validation.status == 'suggested' else None
+                )
+                st.session_state.pending_retry = False
+                logging.info(f"Captured: label={label} entity={entity}")
+
+        # nested so a new capture refreshes it, while its own buttons rerun only this part
+        render_confirmation_section()
+
+
+@st.fragment
 def render_confirmation_section():
-    if st.session_state.pending_retry:
-        if st.button("🔁 Try Again"):
-            reset_current_capture()
-        return
-
-    label = st.session_state.predicted_label
-    entity = st.session_state.extracted_entity
-    if not label:
-        st.info("No label predicted yet. Try capturing speech again with clearer wording (e.g., 'My name is ...', 'Phone number is ...').")
-        return
-    manual_entry = None
-    if not entity:
-        st.warning("Label predicted but no entity extracted. You can enter it manually or retry.")
-        manual_entry = st.text_input("Enter value manually", key="manual_entry")
-    st.subheader("2. Confirm Extraction")
-    st.markdown(
-        f"<div class='entity-box'><span class='good-pill'>Predicted Field</span> <strong>{label}</strong><br><span class='good-pill'>Extracted Value</span> <code>{entity}</code></div>",
-        unsafe_allow_html=True,
-    )
-    if not entity:
-        st.caption("Tip: Say phrases like 'my phone number is nine eight seven ...' or 'amount is five thousand rupees'.")
-    c1, c2, c3 = st.columns([1,1,2])
-    with c1:
-        if st.button("✅ Confirm", key="confirm_entity"):
-            if not st.session_state.extracted_entity and manual_entry:
-                st.session_state.extracted_entity = manual_entry
-            confirm_entity()
+    rerun_app_if_form_changed()
+    with track_cpu("confirmation"):
+        if st.session_state.pop("saved_notice", False):
             st.success("Saved to form.")
-    with c2:
-        if st.button("❌ Not Correct", key="retry_entity"):
-            reset_current_capture()
-            st.info("Please capture again.")
-    with c3:
-        placeholder = FIELD_KEY_MAP.get(label)
-        if placeholder:
-            existing = st.session_state.form_data.get(placeholder, "")
-            if existing and existing != entity:
-                st.caption("Note: This will overwrite the previous value if confirmed.")
-
-
+        if st.session_state.captured_text:
+            st.markdown("**Transcript:**")
+            st.info(st.session_state.captured_text)
+
+        if st.session_state.pending_retry:
+            st.button("🔁 Try Again", on_click=reset_current_capture)
+            return
+
+        label = st.session_state.predicted_label
+        entity = st.session_state.extracted_entity
+        if not label:
+            st.info("No label predicted yet. Try capturing speech again with clearer wording (e.g., 'My name is ...', 'Phone number is ...').")
+            return
+        if not entity:
+            st.warning("Label predicted but no entity extracted. You can enter it manually or retry.")
+            st.text_input("Enter value manually", key="manual_entry")
+        st.subheader("2. Confirm Extraction")
+        st.markdown(
+            f"<div class='entity-box'><span class='good-pill'>Predicted Field</span> <strong>{label}</strong><br><span class='good-pill'>Extracted Value</span> <code>{entity}</code></div>",
+            unsafe_allow_html=True,
+        )
+        suggestion = st.session_state.get("suggested_entity")
+        if suggestion:
+            st.warning(f"Heard {entity}, did you mean {suggestion}?" if entity else f"Did you mean {suggestion}?")
+            st.button(f"Use {suggestion}", key="accept_suggestion", on_click=on_accept_suggestion)
+        if not entity:
+            st.caption("Tip: Say phrases like 'my phone number is nine eight seven ...' or 'amount is five thousand rupees'.")
+        c1, c2, c3 = st.columns([1,1,2])
+        with c1:
+            st.button("✅ Confirm", key="confirm_entity", on_click=on_confirm_entity)
+        with c2:
+            st.button("❌ Not Correct", key="retry_entity", on_click=reset_current_capture)
+        with c3:
+            placeholder = FIELD_KEY_MAP.get(label)
+            if placeholder:
+                existing = st.session_state.form_data.get(placeholder, "")
+                if existing and existing != entity:
+                    st.caption("Note: This will overwrite the previous value if confirmed.")
+
+
+@st.fragment
 def render_form_editor():
-    st.subheader("3. Review & Edit Form")
-    edited = False
-    for f in TARGET_FIELDS_ORDER:
-        key = FIELD_KEY_MAP[f]
-        current = st.session_state.form_data[key]
-        new_val = st.text_input(f, value=current, key=f"edit_{key}")
-        if new_val != current:
-            st.session_state.form_data[key] = new_val
-            edited = True
-    if edited:
-        st.success("Form updated.")
-    st.download_button(
-        label="📝 Download TXT",
-        data=download_form_txt(),
-        file_name="form_summary.txt",
-        mime="text/plain",
-    )
-    if st.button("🖨 Print (Browser Dialog)"):
-        st.info("Use your browser's print dialog (Ctrl+P / Cmd+P).")
-        st.markdown("<script>window.print()</script>", unsafe_allow_html=True)
+    rerun_app_if_form_changed()
+    with track_cpu("form_editor"):
+        st.subheader("3. Review & Edit Form")
+        for f in TARGET_FIELDS_ORDER:
+            key = FIELD_KEY_MAP[f]
+            st.text_input(f, value=st.session_state.form_data[key], key=f"edit_{key}", on_change=on_field_edit, args=(key,))
+        if st.session_state.pop("form_edited", False):
+            st.success("Form updated.")
+        st.download_button(
+            label="📝 Download TXT",
+            data=download_form_txt(),
+            file_name="form_summary.txt",
+            mime="text/plain",
+        )
+        if st.button("🖨 Print (Browser Dialog)"):
+            st.info("Use your browser's print dialog (Ctrl+P / Cmd+P).")
+            st.markdown("<script>window.print()</script>", unsafe_allow_html=True)
 
 
 def render_reset_options():
@@ -432,21 +516,21 @@ def render_reset_options():
 
 def main():
     try:
-        init_session_state()
-        inject_custom_css()
-        render_header()
-        render_progress()
-        render_field_status_panel()
-
-        if not all_fields_filled():
-            render_capture_section()
-            render_confirmation_section()
-        else:
-            st.success("All fields captured! You can edit or download below.")
-            render_form_editor()
-
-        render_reset_options()
-        st.markdown("<div class='footer-note'>Voice Activated Form Assistant • Session based • Experimental UI</div>", unsafe_allow_html=True)
+        with track_cpu("app"):
+            init_session_state()
+            inject_custom_css()
+            render_header()
+            render_progress()
+            render_field_status_panel()
+
+            if not all_fields_filled():
+                render_capture_section()
+            else:
+                st.success("All fields captured! You can edit or download below.")
+                render_form_editor()
+
+            render_reset_options()
+            st.markdown("<div class='footer-note'>Voice Activated Form Assistant • Session based • Experimental UI</div>", unsafe_allow_html=True)
 
     except Exception as e:
         logging.error(f"Unhandled exception: {e}")
@@ -4,7 +4,7 @@ import torch
 from assisstants.exception.exception import AssisstantException
 from assisstants.logging.logger import logging
 
-from assisstants.constants import MODEL_PATH
+from assisstants.constants import MODEL_PATH, CLASSIFICATION_LABELS
 from assisstants.loader.model_loader import ModelLoader
 
 # from transformers import DistilBertForSequenceClassification, DistilBertTokenizer
@@ -31,7 +31,7 @@ class TextClassifier:
             with torch.no_grad():
                 outputs = model(**inputs)
             prediction = torch.argmax(outputs.logits, dim=1).item()
-            categories = ["Name", "Phone Number", "Amount", "Account Number"]
+            categories = CLASSIFICATION_LABELS
 
             logging.info(f"Text Classification Completed: {categories[prediction]}")
             return categories[prediction]
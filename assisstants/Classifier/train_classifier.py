@@ -0,0 +1,206 @@
+"""Scripted, reproducible training for the field classifier.
+
+Replaces re-running notebooks/text_Classification.ipynb. Compared with the notebook:
+ - preprocessing runs TextProcessor (the same cleaning used at inference) in parallel
+ - the fast tokenizer is used with dynamic padding instead of padding to max_length=64
+ - batches are grouped by length so short utterances are not padded to long ones
+ - gradient accumulation and checkpoint/resume are supported
+ - the output directory loads with ModelLoader like Models/ClassificationModel
+
+Usage (from the repository root):
+  python -m assisstants.Classifier.train_classifier --output-dir Models/ClassificationModel_v2
+  python -m assisstants.Classifier.train_classifier --output-dir Models/ClassificationModel_v2 --resume
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import pandas as pd
+import torch
+from datasets import Dataset
+from sklearn.metrics import accuracy_score, f1_score
+from sklearn.model_selection import train_test_split
+from transformers import (
+    DataCollatorWithPadding,
+    DistilBertConfig,
+    DistilBertForSequenceClassification,
+    DistilBertTokenizerFast,
+    EarlyStoppingCallback,
+    Trainer,
+    TrainingArguments,
+    set_seed,
+)
+from transformers.trainer_utils import get_last_checkpoint
+
+from assisstants.exception.exception import AssisstantException
+from assisstants.logging.logger import logging
+from assisstants.constants import CLASSIFICATION_LABELS, TRAINING_DATA_PATH
+from assisstants.processor.text_processor import TextProcessor
+
+LABEL_MAPPING = {label: i for i, label in enumerate(CLASSIFICATION_LABELS)}
+
+
+def compute_metrics(pred):
+    labels = pred.label_ids
+    preds = pred.predictions.argmax(-1)
+    acc = accuracy_score(labels, preds)
+    f1 = f1_score(labels, preds, average="weighted")
+    return {"accuracy": acc, "f1": f1}
+
+
+def load_datasets(args, tokenizer):
+    logging.info(f"Loading training data from {args.data}")
+    df = pd.read_csv(args.data)
+    df = df.dropna(subset=["text", "label"])
+    df["label"] = df["label"].map(LABEL_MAPPING)
+    if df["label"].isna().any():
+        raise ValueError(f"Unknown labels in {args.data}; expected one of {CLASSIFICATION_LABELS}")
+
+    train_df, val_df = train_test_split(
+        df[["text", "label"]], test_size=args.val_split, random_state=args.seed, stratify=df["label"]
+    )
+
+    processor = TextProcessor()
+
+    def preprocess(batch):
+        return {"text": [processor.process_text(t) for t in batch["text"]]}
+
+    def tokenize(batch):
+        # no padding here: DataCollatorWithPadding pads each batch to its own longest row.
+        # group_by_length measures input_ids itself; a "length" column would be dropped as
+        # an unused model input before the sampler sees it.
+        return tokenizer(batch["text"], truncation=True, max_length=args.max_length)
+
+    datasets = []
+    for split in (train_df, val_df):
+        ds = Dataset.from_pandas(split.reset_index(drop=True))
+        ds = ds.map(preprocess, batched=True, num_proc=args.num_proc, desc="Preprocessing")
+        ds = ds.map(tokenize, batched=True, remove_columns=["text"], desc="Tokenizing")
+        datasets.append(ds)
+    logging.info(f"Prepared {len(datasets[0])} train / {len(datasets[1])} validation examples")
+    return datasets
+
+
+def build_model(args):
+    # Same configuration the notebook used for Models/ClassificationModel
+    config = DistilBertConfig.from_pretrained(
+        args.base_model,
+        num_labels=len(CLASSIFICATION_LABELS),
+        dropout=0.3,
+        attention_dropout=0.3,
+    )
+    return DistilBertForSequenceClassification.from_pretrained(args.base_model, config=config)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Train the field classifier on CPU or GPU")
+    parser.add_argument("--data", default=TRAINING_DATA_PATH, help="CSV with 'text' and 'label' columns")
+    parser.add_argument("--output-dir", required=True, help="Final model directory, loadable like Models/ClassificationModel")
+    parser.add_argument("--checkpoint-dir", default=None, help="Checkpoints for resume (default: <output-dir>_checkpoints)")
+    parser.add_argument("--base-model", default="distilbert-base-uncased")
+    parser.add_argument("--epochs", type=float, default=5)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--grad-accum", type=int, default=1, help="Gradient accumulation steps")
+    parser.add_argument("--lr", type=float, default=5e-5)
+    parser.add_argument("--weight-decay", type=float, default=0.01)
+    parser.add_argument("--max-length", type=int, default=64, help="Truncation length (batches are padded dynamically)")
+    parser.add_argument("--val-split", type=float, default=0.2)
+    parser.add_argument("--num-proc", type=int, default=os.cpu_count(), help="Processes for preprocessing")
+    parser.add_argument("--dataloader-workers", type=int, default=0)
+    parser.add_argument("--threads", type=int, default=None, help="torch intra-op threads")
+    parser.add_argument("--save-steps", type=int, default=200, help="Checkpoint/evaluation interval in optimizer steps")
+    parser.add_argument("--save-total-limit", type=int, default=2)
+    parser.add_argument("--early-stopping", type=int, default=3, help="Patience in evaluations, 0 disables")
+    parser.add_argument("--resume", nargs="?", const=True, default=None,
+                        help="Resume from the last checkpoint, or from the given checkpoint path")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--deterministic", action="store_true", help="Force deterministic torch kernels (slower)")
+    parser.add_argument("--cpu", action="store_true", help="Train on CPU even if a GPU is available")
+    parser.add_argument("--report-to", default="none", help="e.g. 'tensorboard'")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    try:
+        args = parse_args(argv)
+        set_seed(args.seed)
+        if args.threads:
+            torch.set_num_threads(args.threads)
+        logging.info(f"Classifier training started: {vars(args)}")
+
+        tokenizer = DistilBertTokenizerFast.from_pretrained(args.base_model)
+        train_dataset, val_dataset = load_datasets(args, tokenizer)
+        model = build_model(args)
+
+        checkpoint_dir = args.checkpoint_dir or args.output_dir.rstrip("/\\") + "_checkpoints"
+        training_args = TrainingArguments(
+            output_dir=checkpoint_dir,
+            num_train_epochs=args.epochs,
+            per_device_train_batch_size=args.batch_size,
+            per_device_eval_batch_size=args.batch_size * 2,
+            gradient_accumulation_steps=args.grad_accum,
+            learning_rate=args.lr,
+            weight_decay=args.weight_decay,
+            group_by_length=True,
+            eval_strategy="steps",
+            eval_steps=args.save_steps,
+            save_strategy="steps",
+            save_steps=args.save_steps,
+            save_total_limit=args.save_total_limit,
+            load_best_model_at_end=True,
+            metric_for_best_model="f1",
+            logging_steps=10,
+            seed=args.seed,
+            data_seed=args.seed,
+            full_determinism=args.deterministic,
+            dataloader_num_workers=args.dataloader_workers,
+            use_cpu=args.cpu,
+            report_to=args.report_to,
+        )
+
+        callbacks = [EarlyStoppingCallback(early_stopping_patience=args.early_stopping)] if args.early_stopping else []
+        trainer = Trainer(
+            model=model,
+            args=training_args,
+            train_dataset=train_dataset,
+            eval_dataset=val_dataset,
+            processing_class=tokenizer,
+            data_collator=DataCollatorWithPadding(tokenizer),
+            compute_metrics=compute_metrics,
+            callbacks=callbacks,
+        )
+
+        resume = args.resume
+        if resume is True:
+            resume = get_last_checkpoint(checkpoint_dir) if os.path.isdir(checkpoint_dir) else None
+            if resume is None:
+                logging.info("No checkpoint to resume from, starting fresh")
+        if resume:
+            logging.info(f"Resuming from {resume}")
+
+        train_result = trainer.train(resume_from_checkpoint=resume)
+        trainer.save_model(args.output_dir)
+        tokenizer.save_pretrained(args.output_dir)
+
+        metrics = train_result.metrics
+        metrics.update(trainer.evaluate())
+        # next to the model, not in the checkpoint dir that trainer.save_metrics would use
+        with open(os.path.join(args.output_dir, "all_results.json"), "w", encoding="utf-8") as f:
+            json.dump(metrics, f, indent=4, sort_keys=True)
+
+        device = training_args.device
+        print(f"Device: {device} (torch threads: {torch.get_num_threads()})")
+        print(f"Train examples/s: {metrics.get('train_samples_per_second', float('nan')):.1f}")
+        print(f"Eval examples/s:  {metrics.get('eval_samples_per_second', float('nan')):.1f}")
+        print(f"Eval accuracy: {metrics.get('eval_accuracy', float('nan')):.4f}  f1: {metrics.get('eval_f1', float('nan')):.4f}")
+        print(f"Model written to {args.output_dir}")
+        logging.info(f"Classifier training completed: {metrics}")
+        return metrics
+    except Exception as e:
+        raise AssisstantException(e, sys)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,21 @@
 MODEL_PATH = "Models/ClassificationModel"
 # VOICE_MODEL_PATH = "Models/VoiceModel/deepspeech-0.9.3-models.pbmm"
-# SCORER_PATH = "Models/VoiceModel/deepspeech-0.9.3-models.scorer"
\ No newline at end of file
+# SCORER_PATH = "Models/VoiceModel/deepspeech-0.9.3-models.scorer"
+NAME_GAZETTEER_PATH = "Models/NameGazetteer/name_gazetteer.pkl"
+# A failed load of an optional resource (gazetteer, record index) is retried after this long
+OPTIONAL_LOAD_RETRY_SECONDS = 60.0
+
+# Slow-request profiling (opt-in); overridable with VAFA_PROFILE_* environment variables
+PROFILE_DIR = "profiles"
+PROFILE_SAMPLE_RATE = 0.0
+PROFILE_THRESHOLD_MS = 1000.0
+PROFILE_MAX_FILES = 50
+
+# Classifier output index -> field label (matches label_mapping used in training)
+CLASSIFICATION_LABELS = ["Name", "Phone Number", "Amount", "Account Number"]
+TRAINING_DATA_PATH = "datasets/Epics_Main_dataset.csv"
+
+RECORD_INDEX_PATH = "Models/RecordIndex"
+# "Did you mean" suggestions are off for digit lengths where a random number is expected to
+# have more known neighbours than this (1M ten-digit mobiles ~0.025, 10M ~0.25)
+RECORD_MAX_CHANCE_MATCHES = 0.01
@@ -1,6 +1,7 @@
 import sys
 from assisstants.exception.exception import AssisstantException
 from assisstants.logging.logger import logging
+from assisstants.loader.model_loader import ModelLoader
 
 class ExtractFields:
     def extract(self,label, text):
@@ -24,10 +25,16 @@ class ExtractFields:
                 return amount[0] if amount else []
 
             # Names
+            # Known customer names first (linear-time gazetteer match), NER only when nothing matches
+            gazetteer = ModelLoader.get_name_gazetteer()
+            if gazetteer is not None:
+                name = gazetteer.match(text)
+                if name:
+                    logging.info("Field Extraction Completed (gazetteer)")
+                    return name
+
             # Need to fine tune this NER model with specific Bank database for more better accuracy
-            import spacy
-            
-            nlp = spacy.load("en_core_web_sm")
+            nlp = ModelLoader.get_ner()
 
             doc = nlp(text)
             name = [ent.text for ent in doc.ents if ent.label_ == "PERSON"]
@@ -0,0 +1,231 @@
+"""Name gazetteer backed by an Aho-Corasick automaton.
+
+Customer names, first names and surnames are compiled once into an automaton,
+pickled to disk and loaded once per process. Matching is linear in the length of
+the processed text regardless of how many names the gazetteer holds.
+
+Usage (from the repository root):
+  python -m assisstants.extractor.name_gazetteer build --names customers.txt --names surnames.csv
+  python -m assisstants.extractor.name_gazetteer bench --sizes 10000 100000 1000000
+"""
+
+import argparse
+import csv
+import os
+import pickle
+import random
+import re
+import sys
+import time
+from typing import Iterable, List, Optional, Tuple
+
+import ahocorasick
+
+from assisstants.exception.exception import AssisstantException
+from assisstants.logging.logger import logging
+from assisstants.constants import NAME_GAZETTEER_PATH
+
+
+# Words that appear in customer name lists (Will, Bill, Mark, ...) but far more often as
+# ordinary speech in this app. Entries made only of these words are not indexed.
+NAME_STOP_WORDS = frozenset("""
+a an and are as at be been but by can do for from give go have he her his i if in is it its
+me my myself name no not number of on or our please she so that the their them then there
+this to up us was we will with would you your yes ok okay hello hi sir madam mister mr mrs ms
+account amount phone mobile contact pay paid payment transfer send money cash bank bill
+rupees rupee rs inr dollar dollars lakh crore thousand hundred
+""".split())
+
+# Intro phrases after which the caller states their name
+INTRO_PATTERN = re.compile(r" (?:my name is|name is|i am|this is|myself|call me) ")
+
+
+def normalize_name(text: str) -> str:
+    """Same normalization TextProcessor applies to names: lowercase, no punctuation, single spaces"""
+    text = re.sub(r"[^\w\s]", "", text.lower())
+    return re.sub(r"\s+", " ", text).strip()
+
+
+class NameGazetteer:
+    def __init__(self, automaton: "ahocorasick.Automaton"):
+        self.automaton = automaton
+
+    def __len__(self):
+        return len(self.automaton)
+
+    @classmethod
+    def build(cls, names: Iterable[str]) -> "NameGazetteer":
+        try:
+            logging.info("Name Gazetteer Build Started")
+            automaton = ahocorasick.Automaton()
+            for name in names:
+                key = normalize_name(name)
+                if not key or key.isdigit() or all(t in NAME_STOP_WORDS for t in key.split()):
+                    continue
+                # pad with spaces so only whole tokens can match
+                automaton.add_word(f" {key} ", (len(key) + 2, name.strip()))
+            automaton.make_automaton()
+            logging.info(f"Name Gazetteer Build Completed: {len(automaton)} entries")
+            return cls(automaton)
+        except Exception as e:
+            raise AssisstantException(e, sys)
+
+    def save(self, path: str = NAME_GAZETTEER_PATH):
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "wb") as f:
+                pickle.dump(self.automaton, f, protocol=pickle.HIGHEST_PROTOCOL)
+            logging.info(f"Name Gazetteer saved to {path}")
+        except Exception as e:
+            raise AssisstantException(e, sys)
+
+    @classmethod
+    def load(cls, path: str = NAME_GAZETTEER_PATH) -> "NameGazetteer":
+        try:
+            logging.info(f"Loading Name Gazetteer from {path}")
+            with open(path, "rb") as f:
+                return cls(pickle.load(f))
+        except Exception as e:
+            raise AssisstantException(e, sys)
+
+    def _spans(self, padded: str) -> List[Tuple[int, int, str]]:
+        """Leftmost-longest, non-overlapping matches as (start, end, display name)"""
+        spans = []
+        for end, (length, display) in self.automaton.iter(padded):
+            start = end - length + 1
+            # matches share their separating space, so the word span excludes both pads
+            spans.append((start + 1, end - 1, display))
+        spans.sort(key=lambda s: (s[0], -(s[1] - s[0])))
+
+        selected = []
+        last_end = -1
+        for start, end, display in spans:
+            if start > last_end:
+                selected.append((start, end, display))
+                last_end = end
+        return selected
+
+    def match(self, text: str) -> Optional[str]:
+        """Name right after an intro phrase ("my name is ..."), else the longest run of adjacent names"""
+        normalized = normalize_name(text)
+        if not normalized:
+            return None
+        padded = f" {normalized} "
+        spans = self._spans(padded)
+
+        # merge adjacent matches so "ravi" + "kumar" from separate lists form one name
+        runs = []  # (start, end, [display, ...])
+        for start, end, display in spans:
+            if runs and start == runs[-1][1] + 2:
+                runs[-1] = (runs[-1][0], end, runs[-1][2] + [display])
+            else:
+                runs.append((start, end, [display]))
+        if not runs:
+            return None
+
+        intro = INTRO_PATTERN.search(padded)
+        if intro:
+            for start, end, names in runs:
+                if start == intro.end():
+                    return " ".join(names)
+        start, end, names = max(runs, key=lambda r: r[1] - r[0])
+        return " ".join(names)
+
+
+def read_names(path: str, column: str = "name") -> Iterable[str]:
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.endswith(".csv"):
+            for row in csv.DictReader(f):
+                if row.get(column):
+                    yield row[column]
+        else:
+            for line in f:
+                if line.strip():
+                    yield line
+
+
+def _synthetic_names(count: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    syllables = ["ra", "vi", "ku", "mar", "an", "ja", "li", "sha", "de", "vin", "pri", "ya", "sun", "dar",
+                 "ka", "ran", "mo", "han", "su", "re", "sh", "na", "ta", "ni", "go", "pal", "la", "xmi"]
+
+    def word():
+        return "".join(rng.choice(syllables) for _ in range(rng.randint(2, 4)))
+
+    names = set()
+    while len(names) < count:
+        names.add(" ".join(word() for _ in range(rng.randint(1, 3))).title())
+    return list(names)
+
+
+def benchmark(sizes: List[int], queries: int = 2000, seed: int = 0):
+    import psutil
+    import statistics
+    import tempfile
+
+    process = psutil.Process(os.getpid())
+    print(f"{'entries':>10} {'build s':>9} {'file MB':>9} {'load s':>8} {'RSS MB':>8} {'hit us':>8} {'miss us':>8} {'p99 us':>8}")
+    for size in sizes:
+        names = _synthetic_names(size, seed)
+        start = time.perf_counter()
+        gazetteer = NameGazetteer.build(names)
+        build_s = time.perf_counter() - start
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "gazetteer.pkl")
+            gazetteer.save(path)
+            file_mb = os.path.getsize(path) / (1024 * 1024)
+            del gazetteer
+            rss_before = process.memory_info().rss
+            start = time.perf_counter()
+            gazetteer = NameGazetteer.load(path)
+            load_s = time.perf_counter() - start
+            rss_mb = (process.memory_info().rss - rss_before) / (1024 * 1024)
+
+        rng = random.Random(seed)
+        hits = [f"my name is {rng.choice(names).lower()} and i want to open an account" for _ in range(queries)]
+        misses = ["i would like to transfer 5000 rupees to my savings account today"] * queries
+
+        def timed(texts):
+            samples = []
+            for text in texts:
+                t0 = time.perf_counter_ns()
+                gazetteer.match(text)
+                samples.append((time.perf_counter_ns() - t0) / 1000)
+            samples.sort()
+            return statistics.mean(samples), samples[int(len(samples) * 0.99) - 1]
+
+        hit_mean, hit_p99 = timed(hits)
+        miss_mean, _ = timed(misses)
+        print(f"{size:>10} {build_s:>9.2f} {file_mb:>9.1f} {load_s:>8.2f} {rss_mb:>8.1f} {hit_mean:>8.1f} {miss_mean:>8.1f} {hit_p99:>8.1f}")
+        del gazetteer, names
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or benchmark the Name gazetteer")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="Compile name lists into a serialized gazetteer")
+    build.add_argument("--names", action="append", required=True, help="Name list (.txt one per line, or .csv); repeatable")
+    build.add_argument("--column", default="name", help="Column holding names in .csv inputs")
+    build.add_argument("--out", default=NAME_GAZETTEER_PATH, help="Output path for the serialized gazetteer")
+
+    bench = sub.add_parser("bench", help="Benchmark build time, memory and lookup latency")
+    bench.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    bench.add_argument("--queries", type=int, default=2000)
+
+    args = parser.parse_args(argv)
+    try:
+        if args.command == "build":
+            names = (name for path in args.names for name in read_names(path, args.column))
+            gazetteer = NameGazetteer.build(names)
+            gazetteer.save(args.out)
+            print(f"Gazetteer with {len(gazetteer)} entries written to {args.out}")
+        else:
+            benchmark(args.sizes, args.queries)
+    except Exception as e:
+        raise AssisstantException(e, sys)
+
+
+if __name__ == "__main__":
+    main()
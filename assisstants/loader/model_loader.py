@@ -1,16 +1,28 @@
+import os
 import sys
+import threading
+import time
 import torch
 from transformers import DistilBertForSequenceClassification, DistilBertTokenizer
 
 from assisstants.exception.exception import AssisstantException
 from assisstants.logging.logger import logging
-from assisstants.constants import MODEL_PATH
+from assisstants.constants import MODEL_PATH, NAME_GAZETTEER_PATH, RECORD_INDEX_PATH, OPTIONAL_LOAD_RETRY_SECONDS
 
 class ModelLoader:
     try:
         _model = None
         _tokenizer = None
         _device = None
+        _ner = None
+        _gazetteer = None
+        _gazetteer_checked = False
+        _gazetteer_lock = threading.Lock()
+        _gazetteer_failed_at = float("-inf")
+        _validator = None
+        _validator_checked = False
+        _validator_lock = threading.Lock()
+        _validator_failed_at = float("-inf")
 
         @classmethod
         def _init_device(cls):
@@ -40,5 +52,62 @@ class ModelLoader:
                 except Exception as e:
                     raise AssisstantException(e, sys)
             return cls._model
+
+        @classmethod
+        def get_ner(cls):
+            if cls._ner is None:
+                try:
+                    import spacy
+                    logging.info("Loading spaCy NER model en_core_web_sm")
+                    cls._ner = spacy.load("en_core_web_sm")
+                except Exception as e:
+                    raise AssisstantException(e, sys)
+            return cls._ner
+
+        @staticmethod
+        def _retry_due(failed_at: float) -> bool:
+            return time.monotonic() - failed_at >= OPTIONAL_LOAD_RETRY_SECONDS
+
+        @classmethod
+        def get_name_gazetteer(cls):
+            # Optional: Name extraction falls back to NER when no gazetteer has been built.
+            # Callers arriving during the (slow) load wait for it instead of skipping it;
+            # after a failed load they skip it until the retry interval has passed.
+            if not cls._gazetteer_checked and cls._retry_due(cls._gazetteer_failed_at):
+                with cls._gazetteer_lock:
+                    if not cls._gazetteer_checked and cls._retry_due(cls._gazetteer_failed_at):
+                        if not os.path.exists(NAME_GAZETTEER_PATH):
+                            logging.info("No name gazetteer at %s, using NER only", NAME_GAZETTEER_PATH)
+                        else:
+                            try:
+                                from assisstants.extractor.name_gazetteer import NameGazetteer
+                                cls._gazetteer = NameGazetteer.load(NAME_GAZETTEER_PATH)
+                            except Exception as e:
+                                cls._gazetteer_failed_at = time.monotonic()
+                                logging.error("Name gazetteer load failed, using NER only for the next %.0f s: %s",
+                                              OPTIONAL_LOAD_RETRY_SECONDS, e)
+                                return None
+                        cls._gazetteer_checked = True
+            return cls._gazetteer
+
+        @classmethod
+        def get_record_validator(cls):
+            # Optional: phone/account values are only validated once indexes have been built
+            if not cls._validator_checked and cls._retry_due(cls._validator_failed_at):
+                with cls._validator_lock:
+                    if not cls._validator_checked and cls._retry_due(cls._validator_failed_at):
+                        if not os.path.isdir(RECORD_INDEX_PATH):
+                            logging.info("No record index at %s, skipping validation", RECORD_INDEX_PATH)
+                        else:
+                            try:
+                                from assisstants.validator.record_index import RecordValidator
+                                cls._validator = RecordValidator.load(RECORD_INDEX_PATH)
+                            except Exception as e:
+                                cls._validator_failed_at = time.monotonic()
+                                logging.error("Record index load failed, skipping validation for the next %.0f s: %s",
+                                              OPTIONAL_LOAD_RETRY_SECONDS, e)
+                                return None
+                        cls._validator_checked = True
+            return cls._validator
     except Exception as e:
         raise AssisstantException(e, sys)
\ No newline at end of file
@@ -0,0 +1,380 @@
+"""Open-loop load test harness for the Voice Activated Form Assistant pipeline.
+
+Drives many simulated sessions through the same code path as
+``app.process_and_extract`` (or through a local HTTP endpoint) using a replay
+corpus, and reports throughput, tail latency, error rate and CPU/RSS over time.
+
+Usage (from the repository root):
+  python -m assisstants.loadtest.load_tester --corpus replay.jsonl --sessions 16 --rates 1,2,4,8,16
+  python -m assisstants.loadtest.load_tester --corpus replay.txt --target http://127.0.0.1:8000/extract --pid 4242
+
+HTTP mode is for a service wrapping the same pipeline; the Streamlit app does not
+expose one. The endpoint must accept, per utterance, a POST of either
+ - Content-Type application/json, body {"text": "<transcript>"}, or
+ - Content-Type audio/wav, body the raw WAV bytes (with --use-wav),
+run transcription (for WAV) and process_and_extract, and answer 2xx with JSON
+{"label": ..., "entity": ...}. Any non-2xx status, a timeout or a response without a
+"label" is counted as an error. Pass --pid so CPU/RSS are sampled from the server.
+
+Corpus formats:
+ - .jsonl : one utterance per line, {"text": "my name is ravi kumar", "wav": "optional/path.wav"}
+ - other  : plain text, one transcript per line
+
+Arrivals are open-loop (Poisson at each offered rate), so latency is measured from
+the scheduled arrival time and includes queueing once the host saturates.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+from typing import Callable, Dict, List, Optional
+
+import psutil
+
+from assisstants.exception.exception import AssisstantException
+from assisstants.logging.logger import logging
+
+# Transcripts the app treats as failed captures
+FAILED_TRANSCRIPTS = ("[Unrecognized Speech]", "[API Error]", "")
+
+
+@dataclass
+class Utterance:
+    text: str
+    wav: Optional[str] = None
+
+
+@dataclass
+class RequestResult:
+    session: int
+    scheduled: float
+    started: float
+    finished: float
+    ok: bool
+    error: Optional[str] = None
+
+    @property
+    def latency(self) -> float:
+        return self.finished - self.scheduled
+
+    @property
+    def queue_wait(self) -> float:
+        return self.started - self.scheduled
+
+
+@dataclass
+class ResourceSample:
+    t: float
+    cpu_percent: float
+    rss_mb: float
+
+
+@dataclass
+class StepReport:
+    offered_rate: float
+    duration: float
+    sent_rate: float
+    sent: int
+    completed: int
+    errors: int
+    throughput: float
+    error_rate: float
+    latency_ms: Dict[str, float]
+    error_latency_ms: Dict[str, float]
+    queue_wait_ms_mean: float
+    cpu_percent_mean: float
+    cpu_percent_max: float
+    rss_mb_max: float
+    timeline: List[Dict[str, float]] = field(default_factory=list)
+
+
+def load_corpus(path: str) -> List[Utterance]:
+    try:
+        corpus = []
+        base_dir = os.path.dirname(os.path.abspath(path))
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                if path.endswith(".jsonl"):
+                    row = json.loads(line)
+                    wav = row.get("wav")
+                    if wav and not os.path.isabs(wav):
+                        wav = os.path.join(base_dir, wav)
+                    corpus.append(Utterance(text=row.get("text", ""), wav=wav))
+                else:
+                    corpus.append(Utterance(text=line))
+        if not corpus:
+            raise ValueError(f"Replay corpus {path} is empty")
+        logging.info(f"Loaded replay corpus: {len(corpus)} utterances from {path}")
+        return corpus
+    except Exception as e:
+        raise AssisstantException(e, sys)
+
+
+def local_target(use_wav: bool) -> Callable[[Utterance], object]:
+    """Call the Streamlit app's own pipeline in-process"""
+    import app
+    from assisstants.voice.voice import transcribe_audio_file
+
+    def call(utterance: Utterance):
+        text = utterance.text
+        if use_wav and utterance.wav:
+            text = transcribe_audio_file(utterance.wav)
+            if text in FAILED_TRANSCRIPTS:
+                raise RuntimeError(f"Transcription failed: {text}")
+        processed, label, entity, _ = app.process_and_extract(text)
+        if not label:
+            raise RuntimeError("No label predicted")
+        return label, entity
+
+    return call
+
+
+def http_target(url: str, use_wav: bool, timeout: float) -> Callable[[Utterance], object]:
+    """POST each utterance to a local endpoint (see the module docstring for the contract)"""
+    import requests
+
+    local = threading.local()
+
+    def call(utterance: Utterance):
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+        if use_wav and utterance.wav:
+            with open(utterance.wav, "rb") as f:
+                response = session.post(url, data=f.read(), headers={"Content-Type": "audio/wav"}, timeout=timeout)
+        else:
+            response = session.post(url, json={"text": utterance.text}, timeout=timeout)
+        response.raise_for_status()
+        body = response.json()
+        if not body.get("label"):
+            raise RuntimeError("No label predicted")
+        return body["label"], body.get("entity")
+
+    return call
+
+
+class ResourceSampler:
+    """Samples CPU and RSS of a process on a background thread"""
+
+    def __init__(self, pid: Optional[int] = None, interval: float = 1.0):
+        self.process = psutil.Process(pid or os.getpid())
+        self.interval = interval
+        self.samples: List[ResourceSample] = []
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _run(self):
+        self.process.cpu_percent(None)  # prime the counter
+        while not self._stop.wait(self.interval):
+            try:
+                with self.process.oneshot():
+                    cpu = self.process.cpu_percent(None)
+                    rss = self.process.memory_info().rss / (1024 * 1024)
+            except psutil.Error as e:
+                logging.warning(f"Resource sampling stopped: {e}")
+                break
+            self.samples.append(ResourceSample(time.perf_counter(), cpu, rss))
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> List[ResourceSample]:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval * 2)
+        return self.samples
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100.0 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class LoadTester:
+    def __init__(self, target: Callable[[Utterance], object], corpus: List[Utterance], sessions: int,
+                 pid: Optional[int] = None, sample_interval: float = 1.0, seed: int = 0):
+        self.target = target
+        self.corpus = corpus
+        self.sessions = sessions
+        self.pid = pid
+        self.sample_interval = sample_interval
+        self.rng = random.Random(seed)
+        self._cursor = 0
+
+    def _next_utterance(self) -> Utterance:
+        utterance = self.corpus[self._cursor % len(self.corpus)]
+        self._cursor += 1
+        return utterance
+
+    def _execute(self, session: int, utterance: Utterance, scheduled: float) -> RequestResult:
+        started = time.perf_counter()
+        try:
+            self.target(utterance)
+            return RequestResult(session, scheduled, started, time.perf_counter(), True)
+        except Exception as e:
+            return RequestResult(session, scheduled, started, time.perf_counter(), False, f"{type(e).__name__}: {e}")
+
+    def warmup(self, count: int):
+        for _ in range(count):
+            result = self._execute(0, self._next_utterance(), time.perf_counter())
+            if not result.ok:
+                logging.warning(f"Warm-up request failed: {result.error}")
+
+    def run_step(self, rate: float, duration: float) -> StepReport:
+        logging.info(f"Load step started: rate={rate}/s duration={duration}s sessions={self.sessions}")
+        sampler = ResourceSampler(self.pid, self.sample_interval)
+        futures = []
+        with ThreadPoolExecutor(max_workers=self.sessions, thread_name_prefix="session") as pool:
+            sampler.start()
+            start = time.perf_counter()
+            scheduled = start
+            sent = 0
+            while True:
+                scheduled += self.rng.expovariate(rate)
+                if scheduled - start >= duration:
+                    break
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                futures.append(pool.submit(self._execute, sent % self.sessions, self._next_utterance(), scheduled))
+                sent += 1
+            results = [f.result() for f in futures]
+        elapsed = time.perf_counter() - start
+        samples = sampler.stop()
+        return self._summarize(rate, duration, elapsed, start, results, samples)
+
+    def _summarize(self, rate: float, duration: float, elapsed: float, start: float,
+                   results: List[RequestResult], samples: List[ResourceSample]) -> StepReport:
+        ok = [r for r in results if r.ok]
+        errors = len(results) - len(ok)
+        # failed requests stay in the latency distribution: near saturation they are
+        # mostly timeouts, and dropping them would make the tail look better
+        latencies = sorted(r.latency * 1000 for r in results)
+        error_latencies = sorted(r.latency * 1000 for r in results if not r.ok)
+
+        timeline = []
+        for s in samples:
+            window_end = s.t - start
+            done = sum(1 for r in ok if window_end - self.sample_interval < r.finished - start <= window_end)
+            timeline.append({
+                "t": round(window_end, 2),
+                "completed_per_s": round(done / self.sample_interval, 2),
+                "cpu_percent": s.cpu_percent,
+                "rss_mb": round(s.rss_mb, 1),
+            })
+
+        cpu = [s.cpu_percent for s in samples]
+        report = StepReport(
+            offered_rate=rate,
+            duration=round(elapsed, 2),
+            sent_rate=round(len(results) / duration, 2),
+            sent=len(results),
+            completed=len(ok),
+            errors=errors,
+            throughput=round(len(ok) / max(elapsed, duration), 2),
+            error_rate=round(errors / len(results), 4) if results else 0.0,
+            latency_ms={
+                "p50": round(percentile(latencies, 50), 1),
+                "p90": round(percentile(latencies, 90), 1),
+                "p99": round(percentile(latencies, 99), 1),
+                "max": round(latencies[-1], 1) if latencies else 0.0,
+            },
+            error_latency_ms={
+                "p50": round(percentile(error_latencies, 50), 1),
+                "max": round(error_latencies[-1], 1) if error_latencies else 0.0,
+            },
+            queue_wait_ms_mean=round(sum(r.queue_wait for r in results) * 1000 / len(results), 1) if results else 0.0,
+            cpu_percent_mean=round(sum(cpu) / len(cpu), 1) if cpu else 0.0,
+            cpu_percent_max=max(cpu) if cpu else 0.0,
+            rss_mb_max=round(max(s.rss_mb for s in samples), 1) if samples else 0.0,
+            timeline=timeline,
+        )
+        for r in results:
+            if not r.ok:
+                logging.warning(f"Load step request failed (session {r.session}): {r.error}")
+        logging.info(f"Load step completed: {asdict(report)}")
+        return report
+
+
+def find_saturation(reports: List[StepReport], min_efficiency: float = 0.9) -> Optional[float]:
+    """First offered rate where successful completions fall behind arrivals; errors count as misses"""
+    for report in reports:
+        if report.throughput < report.sent_rate * min_efficiency:
+            return report.offered_rate
+    return None
+
+
+def print_reports(reports: List[StepReport]):
+    header = f"{'rate/s':>8} {'sent':>6} {'sent/s':>8} {'thru/s':>8} {'err%':>6} {'p50ms':>9} {'p90ms':>9} {'p99ms':>9} {'maxms':>9} {'errp50ms':>9} {'cpu%avg':>8} {'cpu%max':>8} {'rssMB':>8}"
+    print(header)
+    print("-" * len(header))
+    for r in reports:
+        print(f"{r.offered_rate:>8g} {r.sent:>6} {r.sent_rate:>8.2f} {r.throughput:>8.2f} {r.error_rate * 100:>6.1f} "
+              f"{r.latency_ms['p50']:>9.1f} {r.latency_ms['p90']:>9.1f} {r.latency_ms['p99']:>9.1f} {r.latency_ms['max']:>9.1f} {r.error_latency_ms['p50']:>9.1f} "
+              f"{r.cpu_percent_mean:>8.1f} {r.cpu_percent_max:>8.1f} {r.rss_mb_max:>8.1f}")
+    saturation = find_saturation(reports)
+    if saturation is None:
+        print("No saturation observed at the offered rates.")
+    else:
+        print(f"Saturation: throughput fell below offered load at {saturation:g} req/s.")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Open-loop load test for the form assistant pipeline")
+    parser.add_argument("--corpus", required=True, help="Replay corpus (.jsonl with text/wav, or .txt)")
+    parser.add_argument("--target", default="local", help="'local' for app.process_and_extract, or an http:// endpoint URL")
+    parser.add_argument("--sessions", type=int, default=8, help="Concurrent simulated sessions")
+    parser.add_argument("--rates", default="1,2,4,8", help="Comma separated offered arrival rates (requests/s)")
+    parser.add_argument("--step-duration", type=float, default=30.0, help="Seconds spent at each rate")
+    parser.add_argument("--use-wav", action="store_true", help="Replay WAV files where the corpus provides them")
+    parser.add_argument("--warmup", type=int, default=3, help="Requests sent before measuring")
+    parser.add_argument("--pid", type=int, default=None, help="Process to sample CPU/RSS from (defaults to this process)")
+    parser.add_argument("--sample-interval", type=float, default=1.0, help="CPU/RSS sampling interval in seconds")
+    parser.add_argument("--timeout", type=float, default=30.0, help="HTTP request timeout in seconds")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for arrival times")
+    parser.add_argument("--report", default=None, help="Write the full JSON report (including timelines) here")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    try:
+        args = parse_args(argv)
+        corpus = load_corpus(args.corpus)
+        if args.target == "local":
+            target = local_target(args.use_wav)
+        else:
+            target = http_target(args.target, args.use_wav, args.timeout)
+
+        tester = LoadTester(target, corpus, args.sessions, pid=args.pid,
+                            sample_interval=args.sample_interval, seed=args.seed)
+        tester.warmup(args.warmup)
+
+        reports = []
+        for rate in (float(r) for r in args.rates.split(",") if r.strip()):
+            reports.append(tester.run_step(rate, args.step_duration))
+        print_reports(reports)
+
+        if args.report:
+            with open(args.report, "w", encoding="utf-8") as f:
+                json.dump({"args": vars(args), "steps": [asdict(r) for r in reports]}, f, indent=2)
+            print(f"Full report written to {args.report}")
+        return reports
+    except Exception as e:
+        raise AssisstantException(e, sys)
+
+
+if __name__ == "__main__":
+    main()
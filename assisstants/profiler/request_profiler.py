@@ -0,0 +1,159 @@
+"""Sampled cProfile capture for slow requests.
+
+Every wrapped stage logs its wall time. A configurable fraction of calls is run under
+cProfile, and the profile is written only when the stage exceeded the latency
+threshold. Profiles go to a bounded on-disk ring (oldest deleted first) as standard
+pstats files with a JSON sidecar of request metadata, so they open directly in
+``python -m pstats``, snakeviz or gprof2dot.
+
+Configuration (environment overrides the defaults in assisstants.constants):
+  VAFA_PROFILE_SAMPLE_RATE   fraction of calls to profile, 0 disables (default 0)
+  VAFA_PROFILE_THRESHOLD_MS  keep profiles of calls slower than this (default 1000)
+  VAFA_PROFILE_DIR           ring directory (default ./profiles)
+  VAFA_PROFILE_MAX_FILES     profiles kept in the ring (default 50)
+"""
+
+import cProfile
+import functools
+import glob
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional
+
+from assisstants.logging.logger import logging
+from assisstants.constants import PROFILE_DIR, PROFILE_SAMPLE_RATE, PROFILE_THRESHOLD_MS, PROFILE_MAX_FILES
+
+
+class RequestProfiler:
+    # cProfile can only be active in one place at a time on newer Pythons; sampled
+    # calls that find it busy are timed but not profiled
+    _active = threading.Lock()
+
+    def __init__(self, sample_rate: float = PROFILE_SAMPLE_RATE, threshold_ms: float = PROFILE_THRESHOLD_MS,
+                 output_dir: str = PROFILE_DIR, max_files: int = PROFILE_MAX_FILES):
+        self.sample_rate = sample_rate
+        self.threshold_ms = threshold_ms
+        self.output_dir = output_dir
+        self.max_files = max_files
+        self._ring_lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "RequestProfiler":
+        # runs at import time: a bad opt-in setting is logged and ignored, never fatal to the app
+        def setting(name, parse, valid, default):
+            raw = os.getenv(name)
+            if raw is None:
+                return default
+            try:
+                value = parse(raw)
+                if valid(value):
+                    return value
+            except ValueError:
+                pass
+            logging.error(f"Ignoring invalid {name}={raw!r}, using {default!r}")
+            return default
+
+        return cls(
+            sample_rate=setting("VAFA_PROFILE_SAMPLE_RATE", float, lambda v: 0 <= v <= 1, PROFILE_SAMPLE_RATE),
+            threshold_ms=setting("VAFA_PROFILE_THRESHOLD_MS", float, lambda v: v >= 0, PROFILE_THRESHOLD_MS),
+            output_dir=os.getenv("VAFA_PROFILE_DIR", PROFILE_DIR),
+            max_files=setting("VAFA_PROFILE_MAX_FILES", int, lambda v: v >= 1, PROFILE_MAX_FILES),
+        )
+
+    def _start_sampled(self) -> Optional[cProfile.Profile]:
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return None
+        if not self._active.acquire(blocking=False):
+            return None
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # another profiling tool already owns the interpreter
+            self._active.release()
+            return None
+        return profiler
+
+    @contextmanager
+    def profile(self, stage: str, threshold_ms: Optional[float] = None, request_id: Optional[str] = None, **metadata):
+        """Time a stage, profiling it when sampled and keeping the profile when it is slow.
+
+        Yields the request id used in the timing log line and the saved profile; pass
+        one in to correlate several stages of the same request.
+        """
+        threshold_ms = self.threshold_ms if threshold_ms is None else threshold_ms
+        request_id = request_id or uuid.uuid4().hex[:12]
+        profiler = self._start_sampled()
+        error = None
+        start = time.perf_counter()
+        try:
+            yield request_id
+        except BaseException as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if profiler is not None:
+                profiler.disable()
+                self._active.release()
+            logging.info(f"Stage {stage} [{request_id}] took {elapsed_ms:.1f} ms{' (profiled)' if profiler else ''}")
+            if profiler is not None and elapsed_ms >= threshold_ms:
+                self._save(profiler, request_id, stage, elapsed_ms, threshold_ms, error, metadata)
+
+    def profiled(self, stage: str, threshold_ms: Optional[float] = None):
+        """Decorator form of profile(); records the size of str arguments, never their content"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                metadata = {"function": func.__qualname__,
+                            "input_chars": [len(a) for a in args if isinstance(a, str)]}
+                with self.profile(stage, threshold_ms, **metadata):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def _save(self, profiler: cProfile.Profile, request_id: str, stage: str, elapsed_ms: float,
+              threshold_ms: float, error: Optional[str], metadata: dict):
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            now = datetime.now()
+            base = os.path.join(self.output_dir, f"{now.strftime('%Y%m%d_%H%M%S_%f')}_{stage}_{request_id}")
+            profiler.dump_stats(base + ".prof")
+            with open(base + ".json", "w", encoding="utf-8") as f:
+                json.dump({
+                    "request_id": request_id,
+                    "stage": stage,
+                    "timestamp": now.isoformat(),
+                    "elapsed_ms": round(elapsed_ms, 2),
+                    "threshold_ms": threshold_ms,
+                    "sample_rate": self.sample_rate,
+                    "pid": os.getpid(),
+                    "thread": threading.current_thread().name,
+                    "error": error,
+                    **metadata,
+                }, f, indent=2)
+            logging.warning(f"Slow stage {stage} [{request_id}] ({elapsed_ms:.1f} ms) profile saved to {base}.prof")
+            self._trim()
+        except Exception as e:
+            # profiling must never fail the request it observes
+            logging.error(f"Could not save profile for stage {stage}: {e}")
+
+    def _trim(self):
+        with self._ring_lock:
+            profiles = sorted(glob.glob(os.path.join(self.output_dir, "*.prof")))
+            for path in profiles[:max(0, len(profiles) - self.max_files)]:
+                for stale in (path, path[:-len(".prof")] + ".json"):
+                    try:
+                        os.remove(stale)
+                    except FileNotFoundError:
+                        pass
+
+
+request_profiler = RequestProfiler.from_env()
+profiled = request_profiler.profiled
@@ -0,0 +1,345 @@
+"""Prebuilt indexes of known account and phone numbers.
+
+Each field is stored as one sorted int64 array per digit count
+(``<index dir>/<field>/len_<n>.npy``), so leading zeros survive and lookups are a
+binary search. Arrays are memory-mapped on load: millions of records open instantly
+and pages are shared between processes.
+
+Single-digit mis-hearings are found by generating every string at edit distance 1
+(substitution, adjacent transposition, dropped or extra digit) and checking them with
+one vectorised binary search per length. For digit strings this bounded neighbourhood
+(at most ~400 candidates for 18 digits) is cheaper than walking a BK-tree over
+millions of records. Only the extracted number itself can be verified. Neighbours, and
+known numbers said elsewhere in the utterance, are only offered as suggestions for the
+user to accept. In a dense index an unknown number is often one digit away from someone
+else's, so neighbour suggestions are switched off for lengths where that is likely
+(threshold: RECORD_MAX_CHANCE_MATCHES, or --max-chance-matches on the CLI).
+
+Usage (from the repository root):
+  python -m assisstants.validator.record_index build --accounts accounts.txt --phones phones.txt
+  python -m assisstants.validator.record_index bench --sizes 100000 1000000 10000000
+  python -m assisstants.validator.record_index check --label "Phone Number" 9876543219
+"""
+
+import argparse
+import glob
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from assisstants.exception.exception import AssisstantException
+from assisstants.logging.logger import logging
+from assisstants.constants import RECORD_INDEX_PATH, RECORD_MAX_CHANCE_MATCHES
+
+MAX_DIGITS = 18  # fits in int64
+PHONE_LENGTHS = (10,)
+ACCOUNT_LENGTHS = tuple(range(6, MAX_DIGITS + 1))
+
+
+def normalize_phone(value: str) -> str:
+    digits = re.sub(r"\D", "", value)
+    if len(digits) == 12 and digits.startswith("91"):
+        return digits[2:]
+    if len(digits) == 11 and digits.startswith("0"):
+        return digits[1:]
+    return digits
+
+
+def normalize_account(value: str) -> str:
+    return re.sub(r"\D", "", value)
+
+
+def find_numbers(text: str, normalize, lengths: Iterable[int]) -> List[str]:
+    """Whole spoken numbers in text that normalize to an allowed length.
+
+    Spoken numbers are often transcribed in groups ("98765 43210", "9 8 7 ..."), so a
+    run of space/hyphen separated digit groups is read as one number. A run is never
+    split: part of a longer number, or two numbers read back to back, is not a number.
+    """
+    lengths = set(lengths)
+    found = []
+    for run in re.findall(r"\d+(?:[\s\-]+\d+)*", text):
+        number = normalize(run)
+        if len(number) in lengths and number not in found:
+            found.append(number)
+    return found
+
+
+class RecordIndex:
+    def __init__(self, arrays: Dict[int, np.ndarray]):
+        self.arrays = arrays
+
+    def __len__(self):
+        return sum(len(a) for a in self.arrays.values())
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in self.arrays.values())
+
+    @classmethod
+    def build(cls, numbers: Iterable[str]) -> "RecordIndex":
+        buckets: Dict[int, List[int]] = {}
+        for number in numbers:
+            if number and len(number) <= MAX_DIGITS and number.isdigit():
+                buckets.setdefault(len(number), []).append(int(number))
+        return cls({length: np.unique(np.array(values, dtype=np.int64)) for length, values in buckets.items()})
+
+    def save(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        for stale in glob.glob(os.path.join(directory, "len_*.npy")):
+            os.remove(stale)
+        for length, array in self.arrays.items():
+            np.save(os.path.join(directory, f"len_{length}.npy"), array)
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> "RecordIndex":
+        arrays = {}
+        for path in glob.glob(os.path.join(directory, "len_*.npy")):
+            length = int(re.search(r"len_(\d+)\.npy$", path).group(1))
+            arrays[length] = np.load(path, mmap_mode="r" if mmap else None)
+        return cls(arrays)
+
+    def _known(self, length: int, values: np.ndarray) -> np.ndarray:
+        array = self.arrays.get(length)
+        if array is None or len(array) == 0 or len(values) == 0:
+            return values[:0]
+        idx = np.searchsorted(array, values)
+        found = array[np.minimum(idx, len(array) - 1)] == values
+        return values[found]
+
+    def contains(self, number: str) -> bool:
+        if not number.isdigit() or len(number) > MAX_DIGITS:
+            return False
+        array = self.arrays.get(len(number))
+        if array is None or len(array) == 0:
+            return False
+        value = int(number)
+        i = int(array.searchsorted(value))
+        return i < len(array) and int(array[i]) == value
+
+    def chance_matches(self, length: int) -> float:
+        """Expected known numbers in the edit-distance-1 neighbourhood of an arbitrary number"""
+        def density(n):
+            array = self.arrays.get(n)
+            if array is None or len(array) == 0:
+                return 0.0
+            # over the span the numbers actually cover (e.g. mobiles only start with 6-9),
+            # but at least one leading digit's worth so a handful of records is not "dense"
+            return len(array) / max(int(array[-1]) - int(array[0]) + 1, 10 ** (n - 1))
+        # substitutions and swaps keep the length, dropped digits shorten it, extra ones lengthen it
+        return (10 * length - 1) * density(length) + length * density(length - 1) + 10 * (length + 1) * density(length + 1)
+
+    def corrections(self, number: str) -> List[str]:
+        """Known numbers at edit distance 1 (substitution, adjacent swap, dropped or extra digit)"""
+        if not number.isdigit() or len(number) > MAX_DIGITS:
+            return []
+        length = len(number)
+        value = int(number)
+        digits = np.array([int(c) for c in number], dtype=np.int64)
+        place = 10 ** np.arange(length - 1, -1, -1, dtype=np.int64)
+
+        # every candidate is computed arithmetically from the prefix/suffix around position i
+        same_length = np.concatenate([
+            # substitutions
+            (value + (np.arange(10, dtype=np.int64)[None, :] - digits[:, None]) * place[:, None]).ravel(),
+            # adjacent transpositions
+            value + (digits[1:] - digits[:-1]) * (place[:-1] - place[1:]),
+        ])
+        found = [str(v).zfill(length) for v in self._known(length, same_length[same_length != value])]
+
+        if length > 1:
+            # dropped digit: the heard number has an extra one, so remove digit i
+            dropped = (value // (place * 10)) * place + value % place
+            found += [str(v).zfill(length - 1) for v in self._known(length - 1, dropped)]
+        if length < MAX_DIGITS:
+            # extra digit: the heard number lost one, so insert d before position i (or at the end)
+            cut = 10 ** np.arange(length, -1, -1, dtype=np.int64)
+            high, low = value // cut, value % cut
+            inserted = (high[:, None] * 10 + np.arange(10, dtype=np.int64)[None, :]) * cut[:, None] + low[:, None]
+            found += [str(v).zfill(length + 1) for v in self._known(length + 1, inserted.ravel())]
+        return sorted(set(found))
+
+
+@dataclass
+class ValidationResult:
+    value: Optional[str]
+    status: str  # verified | suggested | ambiguous | unknown
+    candidates: List[str] = field(default_factory=list)
+
+
+class RecordValidator:
+    FIELDS = {
+        "Phone Number": ("phone_number", normalize_phone, PHONE_LENGTHS),
+        "Account Number": ("account_number", normalize_account, ACCOUNT_LENGTHS),
+    }
+
+    def __init__(self, indexes: Dict[str, RecordIndex], max_chance_matches: float = RECORD_MAX_CHANCE_MATCHES):
+        self.indexes = indexes
+        self.max_chance_matches = max_chance_matches
+
+    @classmethod
+    def load(cls, directory: str = RECORD_INDEX_PATH,
+             max_chance_matches: float = RECORD_MAX_CHANCE_MATCHES) -> "RecordValidator":
+        try:
+            indexes = {}
+            for label, (name, _, _) in cls.FIELDS.items():
+                path = os.path.join(directory, name)
+                if os.path.isdir(path):
+                    indexes[label] = RecordIndex.load(path)
+                    logging.info(f"Loaded {label} index: {len(indexes[label])} records")
+            return cls(indexes, max_chance_matches)
+        except Exception as e:
+            raise AssisstantException(e, sys)
+
+    def suggests_corrections(self, label: str, length: int) -> bool:
+        return label in self.indexes and self.indexes[label].chance_matches(length) <= self.max_chance_matches
+
+    def supports(self, label: Optional[str]) -> bool:
+        return label in self.indexes
+
+    def validate(self, label: str, entity: Optional[str], text: str = "") -> Optional[ValidationResult]:
+        """Verify the extracted number, else collect "did you mean" suggestions for it.
+
+        Only the extracted number can be verified. Suggestions are known numbers said
+        elsewhere in the utterance, then known neighbours of the extracted number (or of
+        the first number in the utterance when nothing was extracted). The result value
+        is always the heard number, never a suggestion.
+        """
+        try:
+            if not self.supports(label):
+                return None
+            index = self.indexes[label]
+            _, normalize, lengths = self.FIELDS[label]
+
+            heard = normalize(entity) if entity else ""
+            if len(heard) not in lengths:
+                heard = ""
+            if heard and index.contains(heard):
+                return ValidationResult(heard, "verified", [heard])
+
+            spoken = [n for n in find_numbers(text, normalize, lengths) if n != heard]
+            suggestions = [n for n in spoken if index.contains(n)]
+            base = heard or (spoken[0] if spoken else None)
+            if base is None:
+                return ValidationResult(None, "unknown")
+            if self.suggests_corrections(label, len(base)):
+                suggestions += [n for n in index.corrections(base) if n not in suggestions]
+            else:
+                logging.info(f"{label} index too dense at {len(base)} digits for correction suggestions")
+
+            value = heard or None
+            if len(suggestions) == 1:
+                return ValidationResult(value, "suggested", suggestions)
+            if suggestions:
+                return ValidationResult(value, "ambiguous", suggestions)
+            return ValidationResult(value, "unknown")
+        except Exception as e:
+            raise AssisstantException(e, sys)
+
+
+def read_numbers(path: str, normalize) -> Iterable[str]:
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            number = normalize(line)
+            if number:
+                yield number
+
+
+def benchmark(sizes: List[int], digits: int = 12, queries: int = 5000, seed: int = 0,
+              max_chance_matches: float = RECORD_MAX_CHANCE_MATCHES):
+    import tempfile
+
+    rng = np.random.default_rng(seed)
+    low, high = 10 ** (digits - 1), 10 ** digits
+    # MB is the size of the memory-mapped arrays; pages are only resident once touched.
+    # chance is the expected known neighbours of a random number; validate() only offers
+    # corrections (fix us) when it is <= max_chance_matches
+    print(f"{'records':>10} {'build s':>8} {'MB':>7} {'load ms':>8} {'hit us':>7} {'miss us':>8} {'fix us':>7} "
+          f"{'chance':>7} {'suggest':>7}")
+    for size in sizes:
+        numbers = [str(v) for v in rng.integers(low, high, size=size)]
+        start = time.perf_counter()
+        index = RecordIndex.build(numbers)
+        build_s = time.perf_counter() - start
+
+        with tempfile.TemporaryDirectory() as tmp:
+            index.save(tmp)
+            start = time.perf_counter()
+            index = RecordIndex.load(tmp)
+            load_ms = (time.perf_counter() - start) * 1000
+
+            hits = [numbers[i] for i in rng.integers(0, size, size=queries)]
+            misses = [str(v) for v in rng.integers(low, high, size=queries)]
+            # one wrong digit in a known number
+            typos = [n[:-3] + str((int(n[-3]) + 1) % 10) + n[-2:] for n in hits]
+
+            def timed(fn, items):
+                start = time.perf_counter()
+                for item in items:
+                    fn(item)
+                return (time.perf_counter() - start) * 1e6 / len(items)
+
+            hit_us = timed(index.contains, hits)
+            miss_us = timed(index.contains, misses)
+            fix_us = timed(index.corrections, typos)
+            chance = index.chance_matches(digits)
+            suggest = "yes" if chance <= max_chance_matches else "no"
+            print(f"{size:>10} {build_s:>8.2f} {index.nbytes / 2**20:>7.1f} {load_ms:>8.2f} {hit_us:>7.2f} {miss_us:>8.2f} {fix_us:>7.1f} "
+                  f"{chance:>7.4f} {suggest:>7}")
+            del index
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or benchmark the known-number indexes")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="Build indexes from number lists (one per line)")
+    build.add_argument("--accounts", help="Known account numbers")
+    build.add_argument("--phones", help="Known phone numbers")
+    build.add_argument("--out", default=RECORD_INDEX_PATH)
+
+    bench = sub.add_parser("bench", help="Benchmark build time, memory and lookup latency")
+    bench.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000, 10_000_000])
+    bench.add_argument("--digits", type=int, default=12)
+
+    check = sub.add_parser("check", help="Validate numbers against the built indexes")
+    check.add_argument("numbers", nargs="+")
+    check.add_argument("--label", choices=list(RecordValidator.FIELDS), default="Phone Number")
+    check.add_argument("--index", default=RECORD_INDEX_PATH)
+
+    for command in (bench, check):
+        command.add_argument("--max-chance-matches", type=float, default=RECORD_MAX_CHANCE_MATCHES,
+                             help="Offer corrections only below this many expected chance neighbours")
+
+    args = parser.parse_args(argv)
+    try:
+        if args.command == "build":
+            sources = [("Account Number", args.accounts), ("Phone Number", args.phones)]
+            for label, path in sources:
+                if not path:
+                    continue
+                name, normalize, _ = RecordValidator.FIELDS[label]
+                index = RecordIndex.build(read_numbers(path, normalize))
+                index.save(os.path.join(args.out, name))
+                print(f"{label}: {len(index)} records indexed in {os.path.join(args.out, name)}")
+        elif args.command == "check":
+            validator = RecordValidator.load(args.index, args.max_chance_matches)
+            if not validator.supports(args.label):
+                print(f"No {args.label} index in {args.index}")
+                return
+            for number in args.numbers:
+                result = validator.validate(args.label, number)
+                print(f"{number}: {result.status} {' '.join(result.candidates)}")
+        else:
+            benchmark(args.sizes, args.digits, max_chance_matches=args.max_chance_matches)
+    except Exception as e:
+        raise AssisstantException(e, sys)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import sys
 from assisstants.logging.logger import logging
 from assisstants.exception.exception import AssisstantException
+from assisstants.profiler.request_profiler import request_profiler
 
 import threading
 import speech_recognition as sr
@@ -23,7 +24,8 @@ class speech_to_text:
                     try:
                         r.adjust_for_ambient_noise(mic, duration=0.5)
                         audio = r.listen(mic, timeout=2, phrase_time_limit=5)
-                        text = r.recognize_google(audio)
+                        with request_profiler.profile("speech_recognition"):
+                            text = r.recognize_google(audio)
                         print("You said:", text)
 
                         with self._lock:
@@ -73,5 +75,22 @@ class speech_to_text:
                 self._transcripts.clear()
             logging.info("Transcripts cleared")
 
+    except Exception as e:
+        raise AssisstantException(e, sys)
+
+
+def transcribe_audio_file(path: str) -> str:
+    """Transcribe a recorded WAV file with the same recognizer used for live capture"""
+    try:
+        r = sr.Recognizer()
+        with sr.AudioFile(path) as source:
+            audio = r.record(source)
+        try:
+            with request_profiler.profile("speech_recognition", source="file"):
+                return r.recognize_google(audio)
+        except sr.UnknownValueError:
+            return "[Unrecognized Speech]"
+        except sr.RequestError:
+            return "[API Error]"
     except Exception as e:
         raise AssisstantException(e, sys)
\ No newline at end of file
@@ -0,0 +1,41 @@
+import pytest
+
+pytest.importorskip("ahocorasick")
+
+from assisstants.extractor.name_gazetteer import NameGazetteer
+
+
+@pytest.fixture(scope="module")
+def gazetteer():
+    return NameGazetteer.build(["Ravi Kumar", "Ravi", "Kumar", "Singh", "Priya", "O'Neil", "Will", "Is", "An", "Mark"])
+
+
+def test_merges_adjacent_names_across_lists(gazetteer):
+    assert gazetteer.match("my name is ravi kumar singh") == "Ravi Kumar Singh"
+
+
+def test_matches_whole_tokens_only(gazetteer):
+    assert gazetteer.match("hello raviraj") is None
+    assert gazetteer.match("i am oneil") == "O'Neil"
+
+
+def test_stop_words_are_not_indexed(gazetteer):
+    assert gazetteer.match("i will pay") is None
+    assert gazetteer.match("this is an account") is None
+    assert gazetteer.match("it is ravi kumar") == "Ravi Kumar"
+
+
+def test_intro_phrase_beats_longer_run(gazetteer):
+    assert gazetteer.match("ravi kumar singh referred me my name is priya") == "Priya"
+    assert gazetteer.match("mark the amount ravi kumar singh") == "Ravi Kumar Singh"
+
+
+def test_no_match(gazetteer):
+    assert gazetteer.match("transfer 5000") is None
+    assert gazetteer.match("") is None
+
+
+def test_save_load_roundtrip(gazetteer, tmp_path):
+    path = str(tmp_path / "gazetteer.pkl")
+    gazetteer.save(path)
+    assert NameGazetteer.load(path).match("this is priya") == "Priya"
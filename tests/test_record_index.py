@@ -0,0 +1,97 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from assisstants.validator.record_index import (
+    ACCOUNT_LENGTHS,
+    MAX_DIGITS,
+    PHONE_LENGTHS,
+    RecordIndex,
+    RecordValidator,
+    find_numbers,
+    normalize_account,
+    normalize_phone,
+)
+
+
+def corrections(known, heard):
+    return RecordIndex.build(known).corrections(heard)
+
+
+def test_substitution():
+    assert corrections(["9876543210"], "9876543219") == ["9876543210"]
+
+
+def test_adjacent_transposition():
+    assert corrections(["9876543210"], "9876543201") == ["9876543210"]
+
+
+def test_dropped_digit():
+    # heard one digit too many
+    assert corrections(["9876543210"], "98765432100") == ["9876543210"]
+    assert corrections(["9876543210"], "19876543210") == ["9876543210"]
+
+
+def test_inserted_digit():
+    # heard one digit too few, at the start, middle and end
+    assert corrections(["9876543210"], "876543210") == ["9876543210"]
+    assert corrections(["9876543210"], "987653210") == ["9876543210"]
+    assert corrections(["9876543210"], "987654321") == ["9876543210"]
+
+
+def test_leading_zeros_survive():
+    index = RecordIndex.build(["000123", "0012345"])
+    assert index.contains("000123")
+    assert not index.contains("123")
+    assert index.corrections("000124") == ["000123"]
+    assert index.corrections("00123") == ["000123"]
+    assert index.corrections("012345") == ["0012345"]
+
+
+def test_max_digits():
+    longest = "9" * MAX_DIGITS
+    index = RecordIndex.build([longest, "9" * (MAX_DIGITS + 1)])
+    assert len(index) == 1
+    assert index.contains(longest)
+    assert index.corrections("9" * (MAX_DIGITS - 1) + "8") == [longest]
+    assert index.corrections("9" * (MAX_DIGITS + 1)) == []
+
+
+def test_no_neighbours_and_exact_hit_excluded():
+    assert corrections(["9876543210"], "1111111111") == []
+    assert corrections(["9876543210"], "9876543210") == []
+
+
+def test_find_numbers_reads_whole_runs_only():
+    assert find_numbers("+91 98765 43210", normalize_phone, PHONE_LENGTHS) == ["9876543210"]
+    assert find_numbers("9 8 7 6 5 4 3 2 1 0", normalize_phone, PHONE_LENGTHS) == ["9876543210"]
+    # neither the joined 14 digits nor a part of them
+    assert find_numbers("9876543210 1234", normalize_phone, PHONE_LENGTHS) == []
+    assert find_numbers("1234 5678 9012", normalize_account, ACCOUNT_LENGTHS) == ["123456789012"]
+
+
+def test_single_neighbour_is_suggested_not_substituted():
+    validator = RecordValidator({"Phone Number": RecordIndex.build(["9876543210"])})
+    result = validator.validate("Phone Number", "9876543219")
+    assert (result.value, result.status, result.candidates) == ("9876543219", "suggested", ["9876543210"])
+    assert validator.validate("Phone Number", "98765 43210").status == "verified"
+
+
+def test_only_the_extracted_number_is_verified():
+    validator = RecordValidator({"Account Number": RecordIndex.build(["56789012", "111122223333"])})
+    # part of the spoken number is another customer's account
+    result = validator.validate("Account Number", "123456789012", "my account number is 1234 5678 9012")
+    assert (result.value, result.status) == ("123456789012", "unknown")
+    # a known number said elsewhere is only a suggestion
+    result = validator.validate("Account Number", "123456789012", "123456789012 or maybe 1111 2222 3333")
+    assert (result.value, result.status, result.candidates) == ("123456789012", "suggested", ["111122223333"])
+    result = validator.validate("Account Number", None, "it is 1111 2222 3333")
+    assert (result.value, result.status, result.candidates) == (None, "suggested", ["111122223333"])
+
+
+def test_dense_index_gives_no_suggestions():
+    indexes = {"Account Number": RecordIndex.build([str(n) for n in range(100000, 100500)])}
+    # 500 numbers over a 10**5 minimum span: chance_matches is 59 * 0.005, about 0.3
+    result = RecordValidator(indexes).validate("Account Number", "100599")
+    assert (result.value, result.status) == ("100599", "unknown")
+    assert RecordValidator(indexes, max_chance_matches=1).validate("Account Number", "100599").status == "ambiguous"